@@ -1,4 +1,4 @@
 #!/usr/bin/env python3
-""" Flask-based local update server """
+""" Minimalistic serial terminal program. """
 
-from tinyterm.tinyterm import main
+from tinyterm.tinyterm import main, SerialConsole
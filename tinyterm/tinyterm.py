@@ -4,7 +4,10 @@ without any kind of screen-drawing, scroll-trapping, etc. """
 
 import sys
 import argparse
+import io
+import re
 import select
+import selectors
 import os
 import tty
 import fcntl
@@ -15,46 +18,45 @@ import subprocess as sp
 import serial
 
 
-def register_cleanup(function, *args, **kwargs):
-    """ Registers a function with atexit and the system exception handler.
-    Function will be called once at exit, regardless of whether the exit was
-    intentional or not. """
+_CLEANUPS = []
+_HOOKS_INSTALLED = False
 
-    # pylint: disable=missing-docstring
-
-    def cleanup():
-        if not cleanup.called:
-            function(*args, **kwargs)
-            cleanup.called = True
 
-    cleanup.called = False
-    atexit.register(cleanup)
-    old_hook = sys.excepthook
+def _run_cleanups():
+    """ Runs every registered cleanup function once, newest-first. Popping
+    from the shared list makes repeat invocations (excepthook followed by
+    atexit) harmless. """
 
-    def new_hook(exception_type, value, traceback):
-        cleanup()
-        return old_hook(exception_type, value, traceback)
+    while _CLEANUPS:
+        function, args, kwargs = _CLEANUPS.pop()
 
-    sys.excepthook = new_hook
+        try:
+            function(*args, **kwargs)
+        except Exception:  # pylint: disable=broad-except
+            pass
 
 
-def register_handler(signum, function, *args, **kwargs):
-    """ Registers a function with a signal handler. Calls the original signal
-    handler (if possible) after running the user-supplied addition. """
+def register_cleanup(function, *args, **kwargs):
+    """ Registers a function with atexit and the system exception handler.
+    Function will be called once at exit, regardless of whether the exit was
+    intentional or not. """
 
     # pylint: disable=missing-docstring
 
-    old_handler = signal.getsignal(signum)
+    global _HOOKS_INSTALLED
 
-    def handler(signum, frame):
-        result = function(*args, **kwargs)
+    if not _HOOKS_INSTALLED:
+        _HOOKS_INSTALLED = True
+        atexit.register(_run_cleanups)
+        old_hook = sys.excepthook
 
-        if callable(old_handler):
-            return old_handler(signum, frame)
+        def new_hook(exception_type, value, traceback):
+            _run_cleanups()
+            return old_hook(exception_type, value, traceback)
 
-        return result
+        sys.excepthook = new_hook
 
-    signal.signal(signum, handler)
+    _CLEANUPS.append((function, args, kwargs))
 
 
 def reopen_stdin():
@@ -86,9 +88,9 @@ class SerialConsole():
 
         self.port = serial.Serial(device, baudrate=baudrate, parity=parity,
                                   timeout=0)
+        self._port_fd = self.port.fileno()
         register_cleanup(self.port.close)
-        signal.signal(signal.SIGINT, signal.SIG_IGN)
-        register_handler(signal.SIGINT, self.port.write, b'\x03')
+        signal.signal(signal.SIGINT, self._sigint)
 
         self.port.reset_input_buffer()
         self.port.reset_output_buffer()
@@ -96,83 +98,215 @@ class SerialConsole():
         self.stop = False
         self.newline = newline
 
+        # One-pass detector for bytes that need the state machine. Extend
+        # the character class if more escape prefixes are ever trapped.
+        self._special = re.compile(b'[\x01]').search
+
+        raw = sys.stdout.buffer
+        raw = getattr(raw, 'raw', raw)
+        self.out = io.BufferedWriter(raw, buffer_size=65536)
+        register_cleanup(self.out.flush)
+        self._interactive = sys.stdout.isatty()
+
+        term = os.getenv('TERM', 'vt100').replace('%', '%%')
+        commands = [
+            "export TERM=" + term,
+            "resize",
+            "export COLUMNS=%s",
+            "export LINES=%s",
+            "export TERM=" + term,
+            "reset"
+        ]
+        prefix = b'\x01\x0B\ntrue\n'
+        self._resize_cmd = prefix + (' && '.join(commands) + '\n').encode()
+
+        self._dispatch = {
+            b'q': self._quit, b'Q': self._quit, b'k': self._quit,
+            b'K': self._quit, b'\\': self._quit,
+            b'r': self._resize, b'R': self._resize,
+            b'z': self._suspend, b'Z': self._suspend,
+            b'?': self._help,
+        }
+
         reopen_stdin()
+        self._in_fd = sys.stdin.fileno()
+
+        # Two registered fds is below the point where io_uring-style batched
+        # submission pays for a native dependency; epoll via DefaultSelector
+        # keeps the wheel pure-Python.
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._port_fd, selectors.EVENT_READ, 'port')
+        self._sel.register(self._in_fd, selectors.EVENT_READ, 'stdin')
+        register_cleanup(self._sel.close)
 
     def __call__(self):
         """ Runs the terminal, passing data from stdin to the serial port
         and back. Traps and interpets CTRL+a. """
 
-        targets = [sys.stdin, self.port]
         trap_next = False
+        unflushed = False
         self.stop = False
-        outbuf = []
+        outbuf = bytearray()
+
+        poll = self._sel.select
+        read = os.read
+        out_write = self.out.write
+        out_flush = self.out.flush
+        send = self._send
+        scan = self._scan
+        translate = self._translate
+        port_fd = self._port_fd
+        in_fd = self._in_fd
+        special = self._special
+        interactive = self._interactive
 
         print("--- Press [CTRL+a] and then ? for help. ---")
+        sys.stdout.flush()
 
         while True:
-            ready = select.select(targets, [], targets)
-
-            if self.port in ready[0]:
-                data = self.port.read()
-                sys.stdout.buffer.write(data)
-                sys.stdout.flush()
-
-            if sys.stdin in ready[0]:
-                data = sys.stdin.read()
-                data = [data[x:x + 1] for x in range(len(data))]
-
-                for char in data:
-                    if trap_next:
-                        outbuf.append(self.interpret(char))
-                        trap_next = False
-                    elif char == self.ctrl_a:
-                        trap_next = True
-                    elif char == b'\r' and self.newline is not None:
-                        pass
-                    elif char == b'\n' and self.newline is not None:
-                        outbuf.append(self.newline)
-                    else:
-                        outbuf.append(char)
+            timeout = 0.005 if interactive and unflushed else None
+            events = poll(timeout)
+
+            if not events:
+                out_flush()
+                unflushed = False
+                continue
+
+            ready = [key.data for key, _ in events]
+
+            if interactive and 'stdin' in ready:
+                out_flush()
+                unflushed = False
+
+            if 'port' in ready:
+                try:
+                    data = read(port_fd, 4096)
+                except BlockingIOError:
+                    data = b''
+
+                out_write(data)
+                unflushed = True
+
+            if 'stdin' in ready:
+                try:
+                    data = read(in_fd, 4096)
+                except BlockingIOError:
+                    data = b''
+
+                if not trap_next and special(data) is None:
+                    if data:
+                        send(translate(data))
+                    continue
+
+                trap_next = scan(data, outbuf, trap_next)
 
                 if self.stop:
                     break
 
-                self.port.write(b''.join(outbuf))
-                outbuf.clear()
+                if outbuf:
+                    send(outbuf)
+                    outbuf.clear()
 
+        self.out.flush()
         print("\n--- Goodbye. ---")
+        sys.stdout.flush()
+
+    def _sigint(self, _signum, _frame):
+        """ Forwards a local Ctrl-C to the attached port as a CTRL+c byte. """
+
+        os.write(self._port_fd, b'\x03')
+
+    def _scan(self, data, outbuf, trap_next):
+        """ Runs the input state machine (normal vs. after-CTRL+a) over one
+        chunk of stdin data, appending outgoing bytes to outbuf. Passthrough
+        spans are located with bytes.find -- a libc memchr scan -- and copied
+        wholesale; only the byte following a CTRL+a is dispatched through
+        interpret(). Returns the state to carry into the next chunk. """
+
+        i = 0
+
+        while i < len(data):
+            if trap_next:
+                outbuf.extend(self.interpret(data[i:i + 1]))
+                trap_next = False
+                i = i + 1
+                continue
+
+            j = data.find(self.ctrl_a, i)
+
+            if j < 0:
+                outbuf.extend(self._translate(data[i:]))
+                break
+
+            if j > i:
+                outbuf.extend(self._translate(data[i:j]))
+
+            trap_next = True
+            i = j + 1
+
+        return trap_next
+
+    def _send(self, payload):
+        """ Writes a payload to the serial port, retrying until every byte
+        has been accepted. Accepts bytes or a bytearray. """
+
+        view = memoryview(payload)
+        written = 0
+
+        while written < len(view):
+            try:
+                written += os.write(self._port_fd, view[written:])
+            except BlockingIOError:
+                select.select([], [self._port_fd], [])
+
+        view.release()
+
+    def _translate(self, span):
+        """ Applies newline translation to a span of passthrough bytes.
+        Carriage-returns are dropped and linefeeds are replaced with the
+        configured newline sequence. """
+
+        if self.newline is None:
+            return span
+
+        return span.replace(b'\r', b'').replace(b'\n', self.newline)
 
     def interpret(self, char):
         """ Interprets a trapped control character. Returns a bytes()
         instance that is sent to the attached port. """
 
-        if char in [b'q', b'Q', b'k', b'K', b'\\']:
-            self.stop = True
-            return b''
-
-        if char in [b'r', b'R']:
-            columns = sp.check_output(["tput", "cols"]).decode().strip()
-            lines = sp.check_output(["tput", "lines"]).decode().strip()
-            commands = [
-                "export TERM=%s" % os.getenv('TERM', 'vt100'),
-                "resize",
-                "export COLUMNS=%s" % columns,
-                "export LINES=%s" % lines,
-                "export TERM=%s" % os.getenv('TERM', 'vt100'),
-                "reset"
-            ]
-            prefix = bytes("\x01\x0B\ntrue\n", 'utf-8')
-            result = prefix + bytes(' && '.join(commands) + '\n', 'utf-8')
-            return result
-
-        if char in [b'?']:
-            self.print_help()
-            return b''
-
-        if char in [b'z', b'Z']:
-            return bytes("\x1A", 'utf-8')
-
-        return char
+        handler = self._dispatch.get(char)
+
+        if handler is None:
+            return char
+
+        return handler()
+
+    def _quit(self):
+        """ Requests an exit from the main loop. """
+
+        self.stop = True
+        return b''
+
+    def _resize(self):
+        """ Builds a command sequence that configures the remote terminal
+        to match the local terminal's type and dimensions. """
+
+        columns = sp.check_output(["tput", "cols"]).strip()
+        lines = sp.check_output(["tput", "lines"]).strip()
+        return self._resize_cmd % (columns, lines)
+
+    def _help(self):
+        """ Displays the help menu on the local terminal. """
+
+        self.out.flush()
+        self.print_help()
+        return b''
+
+    def _suspend(self):
+        """ Sends a literal CTRL+z to the remote end. """
+
+        return b'\x1A'
 
     @staticmethod
     def print_help():
@@ -184,6 +318,7 @@ class SerialConsole():
         print(r" [CTRL+a, r]:            Send terminal-configuration commands")
         print(r" [CTRL+a, CTRL+a]:       Send literal CTRL+a")
         print(r" [CTRL+a, z]:            Send literal CTRL+z")
+        sys.stdout.flush()
 
 
 def _create_parser():